@@ -18,161 +18,371 @@ Cloud Armor Config (13-cloud-armor.tf):
 - Action: Block with 429 status code
 """
 
-import requests
+import asyncio
+import atexit
+import httpx
+import urllib3
 import time
 import argparse
+import array
+import bisect
 import json
 import csv
+import random
+import os
+import signal
 import sys
 import subprocess
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from collections import defaultdict
+from collections import Counter
+from operator import itemgetter
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+def _run_async(coro):
+    """Run coro to completion, on the libuv-based event loop when uvloop is installed"""
+    if uvloop is None:
+        return asyncio.run(coro)
+    if hasattr(uvloop, 'run'):
+        return uvloop.run(coro)
+
+    # uvloop < 0.18 has no run(); hand its loop factory to asyncio instead
+    if hasattr(asyncio, 'Runner'):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+
+    # Python < 3.11 has no Runner either, so fall back to uvloop's loop policy
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return asyncio.run(coro)
+
+def _json_line(obj):
+    """Serialize obj as one newline-terminated JSON line, with orjson when installed"""
+    if orjson is not None:
+        # status_counts has int keys, so allow non-str keys like json does
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj) + '\n').encode()
+
+# Auto-detected endpoint, keyed by kubectl context, reused for an hour
+TARGET_CACHE = Path.home() / '.cache' / 'cloudarmor_target'
+TARGET_CACHE_TTL = 3600
+
+class LatencySample:
+    """Fixed-size reservoir sample of response times (Algorithm R).
+
+    Count, total, min and max are tracked exactly; percentiles are taken
+    from the sample, so memory stays constant however long the test runs.
+    """
+
+    def __init__(self, size=10000):
+        self.size = size
+        self.values = array.array('d')
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+
+    def __len__(self):
+        return self.count
+
+    def add(self, value):
+        """Record one response time"""
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        if len(self.values) < self.size:
+            self.values.append(value)
+        else:
+            # Keep each of the count values with equal probability size/count
+            index = random.randrange(self.count)
+            if index < self.size:
+                self.values[index] = value
 
 class CloudArmorLoadTester:
     def __init__(self, target_url, scenario='baseline', duration=60):
         self.target_url = target_url
         self.scenario = scenario
         self.duration = duration
-        self.session = requests.Session()
-        self.session.headers.update({'User-Agent': 'CloudArmorTester/1.0'})
 
-        # Results tracking
-        self.results = []
-        self.status_counts = defaultdict(int)
-        self.response_times = []
+        # Every request hits the same URL with the same headers, so go straight
+        # to a keep-alive urllib3 pool instead of the requests session pipeline
+        self._pool = urllib3.PoolManager(num_pools=1, maxsize=64,
+                                         headers={'User-Agent': 'CloudArmorTester/1.0'})
+        # Send each request exactly once: connect/read errors are raised unwrapped,
+        # Retry-After and other errors are never retried (total=None stops the
+        # default total=10 from re-sending), but redirects are followed like requests did
+        self._retries = urllib3.Retry(total=None, connect=False, read=False, other=0, redirect=5)
+
+        # Results tracking; per-request rows are streamed to disk as they are
+        # recorded, only their timestamps stay in memory for the report
+        self.timestamps = array.array('d')
+
+        # HTTP status codes are counted by index; TIMEOUT/ERROR stay in the Counter
+        self._code_counts = array.array('Q', bytes(600 * 8))
+        self.status_counts = Counter()
+        self.response_times = LatencySample()
         self.blocked_count = 0
         self.success_count = 0
         self.start_time = None
         self.first_block_time = None
+        self._last_print = 0.0
+
+        # Incremental export, opened when the test starts
+        self._csv_fp = None
+        self._csv = None
+        self._jsonl_fp = None
+        self._csv_sec = None
+        self._csv_sec_str = ''
 
     def detect_load_balancer(self):
         """Auto-detect load balancer IP from kubectl or gcloud"""
         print("Auto-detecting load balancer endpoint...")
 
-        try:
-            # Try kubectl first
-            result = subprocess.run(
-                ['kubectl', 'get', 'ingress', 'tasky-ingress', '-o',
-                 'jsonpath={.status.loadBalancer.ingress[0].ip}'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-
-            if result.returncode == 0 and result.stdout.strip():
-                lb_ip = result.stdout.strip()
-                print(f"Found load balancer IP via kubectl: {lb_ip}")
-                return f"http://{lb_ip}"
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            print("kubectl not available or timed out")
+        commands = {
+            'context': ['kubectl', 'config', 'current-context'],
+            'kubectl': ['kubectl', 'get', 'ingress', 'tasky-ingress', '-o',
+                        'jsonpath={.status.loadBalancer.ingress[0].ip}'],
+            'gcloud': ['gcloud', 'compute', 'addresses', 'list',
+                       '--filter=name:tasky', '--format=value(address)']
+        }
 
+        # Look up the kubectl context (the cache key) and run both probes at
+        # once, all under one deadline; the first successful probe wins. Each
+        # runs in its own session so wrapper scripts can be killed as a group.
+        running = {}
+        for name, command in commands.items():
+            try:
+                running[name] = subprocess.Popen(command, stdout=subprocess.PIPE,
+                                                 stderr=subprocess.DEVNULL, text=True,
+                                                 start_new_session=True)
+            except FileNotFoundError:
+                if name != 'context':
+                    print(f"{name} not available")
+
+        context = None if 'context' in running else ''
+        cached = self._read_cached_target(context) if context == '' else None
+        lb_url = None
+        deadline = time.monotonic() + 10
+
+        while (running and cached is None and (lb_url is None or context is None)
+               and time.monotonic() < deadline):
+            finished = False
+            for name, proc in list(running.items()):
+                if proc.poll() is None:
+                    continue
+
+                del running[name]
+                finished = True
+                output = proc.stdout.read().strip() if proc.returncode == 0 else ''
+
+                if name == 'context':
+                    context = output
+                    # A probe that already answered is fresher than the cache
+                    if lb_url is None:
+                        cached = self._read_cached_target(context)
+                elif output and lb_url is None:
+                    print(f"Found load balancer IP via {name}: {output}")
+                    lb_url = f"http://{output}"
+
+            if not finished:
+                time.sleep(0.05)
+
+        for name, proc in running.items():
+            self._kill_probe(proc)
+            if lb_url is None and cached is None and name != 'context':
+                print(f"{name} timed out")
+
+        if cached:
+            print(f"Using cached load balancer endpoint: {cached}")
+            return cached
+
+        if lb_url is None:
+            print("Could not auto-detect load balancer. Use --target flag.")
+            return None
+
+        self._write_cached_target(context or '', lb_url)
+        return lb_url
+
+    def _kill_probe(self, proc):
+        """Kill a detection probe and any children it spawned (e.g. gcloud's wrapper)"""
         try:
-            # Try gcloud as fallback
-            result = subprocess.run(
-                ['gcloud', 'compute', 'addresses', 'list',
-                 '--filter=name:tasky', '--format=value(address)'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-
-            if result.returncode == 0 and result.stdout.strip():
-                lb_ip = result.stdout.strip()
-                print(f"Found load balancer IP via gcloud: {lb_ip}")
-                return f"http://{lb_ip}"
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            print("gcloud not available or timed out")
-
-        print("Could not auto-detect load balancer. Use --target flag.")
-        return None
+            os.killpg(proc.pid, signal.SIGKILL)
+        except (AttributeError, ProcessLookupError, PermissionError):
+            # No process groups on this platform, or the group already exited
+            proc.kill()
+        proc.wait()
+
+    def _read_cached_target(self, context):
+        """Return the cached endpoint for this context if it is less than an hour old"""
+        try:
+            if time.time() - TARGET_CACHE.stat().st_mtime >= TARGET_CACHE_TTL:
+                return None
+            cached_context, _, url = TARGET_CACHE.read_text().partition('\n')
+        except OSError:
+            return None
+        return url.strip() if cached_context == context and url.strip() else None
+
+    def _write_cached_target(self, context, url):
+        """Remember the detected endpoint for the current kubectl context"""
+        try:
+            TARGET_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            TARGET_CACHE.write_text(f"{context}\n{url}\n")
+        except OSError:
+            pass
 
     def make_request(self):
         """Make a single HTTP request and record results"""
+        start = time.monotonic()
         try:
-            start = time.time()
-            response = self.session.get(self.target_url, timeout=5)
-            elapsed = time.time() - start
-
-            # Record result
-            result = {
-                'timestamp': time.time(),
-                'status_code': response.status_code,
-                'response_time': elapsed,
-                'blocked': response.status_code in [429, 403]
-            }
+            response = self._pool.request('GET', self.target_url, timeout=5.0,
+                                          retries=self._retries)
+        except urllib3.exceptions.NewConnectionError as e:
+            # Subclass of TimeoutError in urllib3, but refused/unresolvable is an error
+            return self._record(time.time(), f'ERROR: {str(e)}', 0, False)
+        except urllib3.exceptions.TimeoutError:
+            return self._record(time.time(), 'TIMEOUT', 0, False)
+        except Exception as e:
+            return self._record(time.time(), f'ERROR: {str(e)}', 0, False)
 
-            self.results.append(result)
-            self.status_counts[response.status_code] += 1
-            self.response_times.append(elapsed)
+        elapsed = time.monotonic() - start
+        status_code = response.status
+        return self._record(time.time(), status_code, elapsed, status_code in (429, 403))
 
-            if result['blocked']:
+    async def make_request_async(self, client, semaphore):
+        """Make a single HTTP request on the async client.
+
+        Returns a (timestamp, status_code, response_time, blocked) row instead
+        of touching shared state; rows are folded in once via aggregate_results.
+        """
+        async with semaphore:
+            start = time.monotonic()
+            try:
+                response = await client.get(self.target_url)
+            except httpx.TimeoutException:
+                return (time.time(), 'TIMEOUT', 0, False)
+            except Exception as e:
+                return (time.time(), f'ERROR: {str(e)}', 0, False)
+
+            elapsed = time.monotonic() - start
+            status_code = response.status_code
+            return (time.time(), status_code, elapsed, status_code in (429, 403))
+
+    def aggregate_results(self, rows):
+        """Record a batch of (timestamp, status_code, response_time, blocked) rows"""
+        record = self._record
+        for row in rows:
+            record(*row)
+
+    def _record(self, timestamp, status_code, elapsed, blocked):
+        """Append one result row and update the running totals"""
+        self.timestamps.append(timestamp)
+
+        if isinstance(status_code, int):
+            if status_code < 600:
+                self._code_counts[status_code] += 1
+            else:
+                self.status_counts[status_code] += 1
+            self.response_times.add(elapsed)
+            if blocked:
                 self.blocked_count += 1
                 if self.first_block_time is None:
-                    self.first_block_time = time.time()
-            elif 200 <= response.status_code < 300:
+                    self.first_block_time = timestamp
+            elif 200 <= status_code < 300:
                 self.success_count += 1
+        elif status_code == 'TIMEOUT':
+            self.status_counts['TIMEOUT'] += 1
+        else:
+            self.status_counts['ERROR'] += 1
 
-            return result
+        if self._csv is not None:
+            self._csv.writerow(self._csv_row(timestamp, status_code, elapsed, blocked))
+            self._jsonl_fp.write(_json_line({
+                'timestamp': timestamp,
+                'status_code': status_code,
+                'response_time': elapsed,
+                'blocked': blocked
+            }))
 
-        except requests.exceptions.Timeout:
-            result = {'timestamp': time.time(), 'status_code': 'TIMEOUT',
-                     'response_time': 0, 'blocked': False}
-            self.results.append(result)
-            self.status_counts['TIMEOUT'] += 1
-            return result
+        return blocked
 
-        except Exception as e:
-            result = {'timestamp': time.time(), 'status_code': f'ERROR: {str(e)}',
-                     'response_time': 0, 'blocked': False}
-            self.results.append(result)
-            self.status_counts['ERROR'] += 1
-            return result
+    def status_distribution(self):
+        """Return request counts per status, HTTP codes first in numeric order"""
+        distribution = {code: count for code, count in enumerate(self._code_counts) if count}
+        distribution.update(sorted(self.status_counts.items(), key=lambda item: str(item[0])))
+        return distribution
 
-    def run_baseline_scenario(self):
-        """Normal user behavior: 20 requests/minute"""
-        print("Running BASELINE scenario (20 req/min)")
-        print("   This should NOT trigger Cloud Armor (threshold: 100 req/min)\n")
+    def _run_paced(self, requests_per_minute, show_blocking=False):
+        """Send requests at a fixed rate until the test duration elapses.
+
+        Each request is scheduled against a monotonic deadline, so request
+        latency does not stretch the interval and lower the real rate.
+        """
+        interval = 60.0 / requests_per_minute
+        monotonic = time.monotonic
+        make_request = self.make_request
+        print_progress = self._print_progress
 
-        requests_per_minute = 20
-        interval = 60.0 / requests_per_minute  # 3 seconds between requests
+        start = monotonic()
+        next_tick = start
+        end_time = start + self.duration
 
-        end_time = self.start_time + self.duration
+        while monotonic() < end_time:
+            make_request()
+            print_progress(start, show_blocking)
 
-        while time.time() < end_time:
-            self.make_request()
-            elapsed = time.time() - self.start_time
-            progress = (elapsed / self.duration) * 100
-            print(f"\rProgress: {progress:.1f}% | Requests: {len(self.results)} | "
-                  f"Success: {self.success_count} | Blocked: {self.blocked_count}", end='')
-            time.sleep(interval)
+            next_tick += interval
+            delay = next_tick - monotonic()
+            if delay > 0:
+                time.sleep(delay)
 
+        self._print_progress(start, show_blocking, force=True)
         print()  # Newline after progress
 
-    def run_rate_limit_scenario(self):
-        """Aggressive load: 150 requests/minute to trigger Cloud Armor"""
-        print("Running RATE-LIMIT scenario (150 req/min)")
-        print("   This WILL trigger Cloud Armor blocking (threshold: 100 req/min)")
-        print("   Expected: Blocks after ~40 seconds, 60-second ban\n")
+    def _print_progress(self, start, show_blocking=False, force=False):
+        """Redraw the progress line, at most every 100ms unless forced"""
+        now = time.monotonic()
+        if not force and now - self._last_print < 0.1:
+            return
+        self._last_print = now
 
-        requests_per_minute = 150
-        interval = 60.0 / requests_per_minute  # 0.4 seconds between requests
+        progress = min((now - start) / self.duration, 1.0) * 100
 
-        end_time = self.start_time + self.duration
+        # Show when blocking starts
+        block_indicator = " BLOCKING!" if show_blocking and self.blocked_count > 0 else ""
+        print(f"\rProgress: {progress:.1f}% | Requests: {len(self.timestamps)} | "
+              f"Success: {self.success_count} | Blocked: {self.blocked_count}{block_indicator}", end='')
 
-        while time.time() < end_time:
-            self.make_request()
-            elapsed = time.time() - self.start_time
-            progress = (elapsed / self.duration) * 100
+    def run_baseline_scenario(self):
+        """Normal user behavior: 20 requests/minute"""
+        print("Running BASELINE scenario (20 req/min)")
+        print("   This should NOT trigger Cloud Armor (threshold: 100 req/min)\n")
 
-            # Show when blocking starts
-            block_indicator = " BLOCKING!" if self.blocked_count > 0 else ""
-            print(f"\rProgress: {progress:.1f}% | Requests: {len(self.results)} | "
-                  f"Success: {self.success_count} | Blocked: {self.blocked_count}{block_indicator}", end='')
+        self._run_paced(20)  # 3 seconds between requests
 
-            time.sleep(interval)
+    def run_rate_limit_scenario(self):
+        """Aggressive load: 150 requests/minute to trigger Cloud Armor"""
+        print("Running RATE-LIMIT scenario (150 req/min)")
+        print("   This WILL trigger Cloud Armor blocking (threshold: 100 req/min)")
+        print("   Expected: Blocks after ~40 seconds, 60-second ban\n")
 
-        print()  # Newline after progress
+        self._run_paced(150, show_blocking=True)  # 0.4 seconds between requests
 
     def run_burst_scenario(self):
         """Sudden burst: 200 requests in 10 seconds"""
@@ -184,41 +394,49 @@ class CloudArmorLoadTester:
 
         print("Sending burst traffic...")
 
-        with ThreadPoolExecutor(max_workers=20) as executor:
-            futures = [executor.submit(self.make_request) for _ in range(total_requests)]
-
-            for i, future in enumerate(as_completed(futures), 1):
-                future.result()
-                if i % 20 == 0:
-                    print(f"  Sent: {i}/{total_requests} | Blocked: {self.blocked_count}")
+        _run_async(self._send_burst(total_requests))
 
         print(f"\nBurst complete. Waiting remaining duration ({self.duration - burst_duration}s)...")
         time.sleep(max(0, self.duration - burst_duration))
 
+    async def _send_burst(self, total_requests):
+        """Issue all burst requests concurrently from a single event loop"""
+        limits = httpx.Limits(max_connections=total_requests, max_keepalive_connections=50)
+        semaphore = asyncio.Semaphore(total_requests)
+
+        async with httpx.AsyncClient(limits=limits, timeout=5.0, follow_redirects=True,
+                                     headers={'User-Agent': 'CloudArmorTester/1.0'}) as client:
+            tasks = [asyncio.create_task(self.make_request_async(client, semaphore))
+                     for _ in range(total_requests)]
+            reporter = asyncio.create_task(self._report_burst_progress(tasks))
+
+            try:
+                rows = await asyncio.gather(*tasks)
+            finally:
+                reporter.cancel()
+
+        print(f"  Sent: {len(rows)}/{total_requests} | Blocked: {sum(row[3] for row in rows)}")
+        # gather returns rows in submission order; keep the timestamp column
+        # sorted so the first-block lookup in print_report can bisect it
+        rows.sort(key=itemgetter(0))
+        self.aggregate_results(rows)
+
+    async def _report_burst_progress(self, tasks, interval=0.5):
+        """Print burst progress from the finished tasks every interval seconds"""
+        while True:
+            await asyncio.sleep(interval)
+            done = [task.result() for task in tasks if task.done()]
+            print(f"  Sent: {len(done)}/{len(tasks)} | Blocked: {sum(row[3] for row in done)}")
+
     def run_sustained_scenario(self):
         """Long-running test at moderate rate: 60 requests/minute"""
         print("Running SUSTAINED scenario (60 req/min)")
         print("   Just below Cloud Armor threshold for stability testing\n")
 
-        requests_per_minute = 60
-        interval = 60.0 / requests_per_minute  # 1 second between requests
-
-        end_time = self.start_time + self.duration
-
-        while time.time() < end_time:
-            self.make_request()
-            elapsed = time.time() - self.start_time
-            progress = (elapsed / self.duration) * 100
-            print(f"\rProgress: {progress:.1f}% | Requests: {len(self.results)} | "
-                  f"Success: {self.success_count} | Blocked: {self.blocked_count}", end='')
-            time.sleep(interval)
-
-        print()  # Newline after progress
+        self._run_paced(60)  # 1 second between requests
 
     def run_test(self):
         """Execute the selected test scenario"""
-        self.start_time = time.time()
-
         scenarios = {
             'baseline': self.run_baseline_scenario,
             'rate-limit': self.run_rate_limit_scenario,
@@ -231,6 +449,12 @@ class CloudArmorLoadTester:
             print(f"Available: {', '.join(scenarios.keys())}")
             sys.exit(1)
 
+        # The burst sends through its own httpx client, so warming the pool
+        # would only add an unmeasured request against the rate limit
+        if self.scenario != 'burst':
+            self.warm_up()
+        self.start_time = time.time()
+
         print(f"\n{'='*70}")
         print(f"Cloud Armor Load Test")
         print(f"{'='*70}")
@@ -240,6 +464,8 @@ class CloudArmorLoadTester:
         print(f"Start Time: {datetime.fromtimestamp(self.start_time).strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"{'='*70}\n")
 
+        self._open_exports()
+
         # Run the scenario
         scenarios[self.scenario]()
 
@@ -249,19 +475,37 @@ class CloudArmorLoadTester:
         self.print_report(total_time)
         self.export_results()
 
+    def warm_up(self):
+        """Send one discarded request so DNS/TCP/TLS setup stays out of the measurements"""
+        try:
+            self._pool.request('GET', self.target_url, timeout=5.0, retries=self._retries)
+        except Exception:
+            pass
+
     def calculate_percentiles(self, data, percentiles=[50, 95, 99]):
         """Calculate percentile values"""
-        if not data:
+        if not len(data):
             return {p: 0 for p in percentiles}
 
-        sorted_data = sorted(data)
-        result = {}
+        # Nearest-rank index, shared by both paths so reports stay comparable
+        indices = [min(int(len(data) * (p / 100.0)), len(data) - 1) for p in percentiles]
 
-        for p in percentiles:
-            index = int(len(sorted_data) * (p / 100.0))
-            result[p] = sorted_data[min(index, len(sorted_data) - 1)]
+        if np is not None:
+            # Partial-sort selection in C instead of a full Python sort
+            selected = np.partition(np.asarray(data, dtype=np.float64), indices)
+            return dict(zip(percentiles, selected[indices].tolist()))
 
-        return result
+        sorted_data = sorted(data)
+        return {p: sorted_data[index] for p, index in zip(percentiles, indices)}
+
+    def calculate_statistics(self, sample, percentiles=[50, 95, 99]):
+        """Calculate average, min, max and percentile values for a LatencySample"""
+        return {
+            'avg': sample.total / sample.count,
+            'min': sample.min,
+            'max': sample.max,
+            'percentiles': self.calculate_percentiles(sample.values, percentiles)
+        }
 
     def print_report(self, total_time):
         """Print comprehensive test report"""
@@ -269,7 +513,7 @@ class CloudArmorLoadTester:
         print("TEST RESULTS")
         print(f"{'='*70}\n")
 
-        total_requests = len(self.results)
+        total_requests = len(self.timestamps)
 
         print(f"Duration: {total_time:.2f}s")
         print(f"Total Requests: {total_requests}")
@@ -277,7 +521,7 @@ class CloudArmorLoadTester:
         print()
 
         print("Status Code Distribution:")
-        for status, count in sorted(self.status_counts.items()):
+        for status, count in self.status_distribution().items():
             percentage = (count / total_requests) * 100
             print(f"  {status}: {count} ({percentage:.1f}%)")
         print()
@@ -287,16 +531,16 @@ class CloudArmorLoadTester:
         print()
 
         if self.response_times:
-            percentiles = self.calculate_percentiles(self.response_times)
-            avg_time = sum(self.response_times) / len(self.response_times)
+            stats = self.calculate_statistics(self.response_times)
+            percentiles = stats['percentiles']
 
             print("Response Time Statistics:")
-            print(f"  Average: {avg_time*1000:.2f}ms")
+            print(f"  Average: {stats['avg']*1000:.2f}ms")
             print(f"  P50 (Median): {percentiles[50]*1000:.2f}ms")
             print(f"  P95: {percentiles[95]*1000:.2f}ms")
             print(f"  P99: {percentiles[99]*1000:.2f}ms")
-            print(f"  Min: {min(self.response_times)*1000:.2f}ms")
-            print(f"  Max: {max(self.response_times)*1000:.2f}ms")
+            print(f"  Min: {stats['min']*1000:.2f}ms")
+            print(f"  Max: {stats['max']*1000:.2f}ms")
             print()
 
         # Cloud Armor Analysis
@@ -306,49 +550,66 @@ class CloudArmorLoadTester:
             print(f"  Block rate: {(self.blocked_count/total_requests)*100:.1f}%")
             print(f"  Cloud Armor is actively protecting the application!")
 
-            # Estimate when rate limit was exceeded
-            requests_before_block = sum(1 for r in self.results
-                                       if r['timestamp'] < self.first_block_time)
+            # Estimate when rate limit was exceeded (timestamps are kept sorted)
+            requests_before_block = bisect.bisect_left(self.timestamps, self.first_block_time)
             print(f"  Requests before first block: {requests_before_block}")
         else:
             print("No blocking detected - rate stayed below Cloud Armor threshold")
 
         print(f"\n{'='*70}\n")
 
-    def export_results(self):
-        """Export results to JSON and CSV"""
+    def _open_exports(self):
+        """Open the CSV and NDJSON result files so rows are written as they are recorded"""
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.csv_file = f"load_test_summary_{self.scenario}_{timestamp}.csv"
+        self.jsonl_file = f"load_test_results_{self.scenario}_{timestamp}.jsonl"
+        self.json_file = f"load_test_results_{self.scenario}_{timestamp}.json"
+
+        self._csv_fp = open(self.csv_file, 'w', newline='')
+        self._csv = csv.writer(self._csv_fp)
+        self._csv.writerow(['Timestamp', 'Status Code', 'Response Time (ms)', 'Blocked'])
+        self._jsonl_fp = open(self.jsonl_file, 'wb')
+
+        # Keep whatever was recorded if the run is interrupted
+        atexit.register(self._close_exports)
+
+    def _close_exports(self):
+        """Flush and close the incremental result files"""
+        if self._csv_fp is not None:
+            self._csv_fp.close()
+            self._jsonl_fp.close()
+            self._csv_fp = self._csv = self._jsonl_fp = None
+
+    def export_results(self):
+        """Close the streamed CSV/NDJSON results and write the JSON run summary"""
+        self._close_exports()
 
-        # JSON export (detailed)
-        json_file = f"load_test_results_{self.scenario}_{timestamp}.json"
-        with open(json_file, 'w') as f:
-            json.dump({
+        with open(self.json_file, 'wb') as f:
+            f.write(_json_line({
                 'scenario': self.scenario,
                 'target': self.target_url,
                 'duration': self.duration,
-                'total_requests': len(self.results),
+                'total_requests': len(self.timestamps),
                 'success_count': self.success_count,
                 'blocked_count': self.blocked_count,
-                'status_counts': dict(self.status_counts),
-                'results': self.results
-            }, f, indent=2)
-
-        print(f"Detailed results exported to: {json_file}")
-
-        # CSV export (summary)
-        csv_file = f"load_test_summary_{self.scenario}_{timestamp}.csv"
-        with open(csv_file, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['Timestamp', 'Status Code', 'Response Time (ms)', 'Blocked'])
-            for r in self.results:
-                writer.writerow([
-                    datetime.fromtimestamp(r['timestamp']).strftime('%Y-%m-%d %H:%M:%S.%f'),
-                    r['status_code'],
-                    f"{r['response_time']*1000:.2f}",
-                    'Yes' if r['blocked'] else 'No'
-                ])
-
-        print(f"Summary exported to: {csv_file}")
+                'status_counts': self.status_distribution(),
+                'results_file': self.jsonl_file
+            }))
+
+        print(f"Detailed results exported to: {self.jsonl_file}")
+        print(f"Run summary exported to: {self.json_file}")
+        print(f"Summary exported to: {self.csv_file}")
+
+    def _csv_row(self, ts, code, rt, blocked):
+        """Build a CSV row, formatting each wall-clock second only once"""
+        sec = int(ts)
+        if sec != self._csv_sec:
+            self._csv_sec_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(sec))
+            self._csv_sec = sec
+        usec = int((ts - sec) * 1_000_000)
+
+        return (f"{self._csv_sec_str}.{usec:06d}", code, format(rt * 1000, '.2f'),
+                'Yes' if blocked else 'No')
 
 def main():
     parser = argparse.ArgumentParser(